@@ -10,6 +10,46 @@ from aws_lambda_powertools import Logger
 
 logger = Logger()
 
+# 키워드 사전
+REGIONS = ["서울", "경기", "인천", "부산", "대구", "광주", "대전", "울산", "세종"]
+SUPPORT_KEYWORDS = {
+    "창업지원": ["창업", "사업", "스타트업"],
+    "취업지원": ["취업", "일자리", "구직"],
+    "주거지원": ["주택", "주거", "임대", "전세"],
+    "교육지원": ["교육", "학습", "연수", "교육비"]
+}
+BUSINESS_KEYWORDS = ["사업자", "창업", "사업"]
+NEGATION_KEYWORDS = ["없", "안", "아니"]
+
+AGE_GROUP_PATTERN = re.compile(r"(\d+)대")
+AGE_PATTERN = re.compile(r"(\d+)살")
+FULL_AGE_PATTERN = re.compile(r"만\s*(\d+)")
+
+def _build_keyword_pattern():
+    """키워드 → (필드, 값, 우선순위) 태그와 단일 정규식 생성"""
+    entries = [(region, "region", region, i) for i, region in enumerate(REGIONS)]
+    for i, (support_type, words) in enumerate(SUPPORT_KEYWORDS.items()):
+        entries.extend((word, "support_type", support_type, i) for word in words)
+    entries.extend((word, "business", True, 0) for word in BUSINESS_KEYWORDS)
+    entries.extend((word, "negation", True, 0) for word in NEGATION_KEYWORDS)
+    
+    tags = {}
+    for word, field, value, priority in entries:
+        tags.setdefault(word, []).append((field, value, priority))
+    
+    # 같은 위치에서는 가장 긴 키워드만 매칭되므로 접두어 키워드의 태그를 합침
+    merged = {
+        word: tuple(tag for other, other_tags in tags.items() if word.startswith(other) for tag in other_tags)
+        for word in tags
+    }
+    
+    # 전방탐색으로 모든 시작 위치에서 (겹치는 키워드 포함) 매칭
+    alternation = "|".join(map(re.escape, sorted(tags, key=len, reverse=True)))
+    return re.compile(f"(?=({alternation}))"), merged
+
+# 모듈 import 시 한 번만 컴파일해 모든 엔진 인스턴스가 공유
+KEYWORD_PATTERN, KEYWORD_TAGS = _build_keyword_pattern()
+
 @dataclass
 class QuestionMetadata:
     """질문 메타데이터"""
@@ -43,49 +83,47 @@ class ConversationEngine:
         """사용자 메시지에서 조건 추출"""
         extracted = current_profile.copy()
         message_lower = message.lower()
+        keywords = self._match_keywords(message_lower)
         
         # 지역 추출
-        regions = ["서울", "경기", "인천", "부산", "대구", "광주", "대전", "울산", "세종"]
-        for region in regions:
-            if region in message:
-                extracted["region"] = region
-                break
+        if "region" in keywords:
+            extracted["region"] = keywords["region"]
         
         # 연령 추출
         age_patterns = [
-            (r"(\d+)대", lambda m: f"{m.group(1)}대"),
-            (r"(\d+)살", lambda m: self._age_to_group(int(m.group(1)))),
-            (r"만\s*(\d+)", lambda m: self._age_to_group(int(m.group(1))))
+            (AGE_GROUP_PATTERN, lambda m: f"{m.group(1)}대"),
+            (AGE_PATTERN, lambda m: self._age_to_group(int(m.group(1)))),
+            (FULL_AGE_PATTERN, lambda m: self._age_to_group(int(m.group(1))))
         ]
         
         for pattern, converter in age_patterns:
-            match = re.search(pattern, message)
+            match = pattern.search(message)
             if match:
                 extracted["age_group"] = converter(match)
                 break
         
         # 사업자 상태
-        if any(word in message_lower for word in ["사업자", "창업", "사업"]):
-            if any(word in message_lower for word in ["없", "안", "아니"]):
+        if keywords.get("business"):
+            if keywords.get("negation"):
                 extracted["business_status"] = "아니오"
             else:
                 extracted["business_status"] = "예"
         
         # 지원 유형 추출
-        support_keywords = {
-            "창업지원": ["창업", "사업", "스타트업"],
-            "취업지원": ["취업", "일자리", "구직"],
-            "주거지원": ["주택", "주거", "임대", "전세"],
-            "교육지원": ["교육", "학습", "연수", "교육비"]
-        }
-        
-        for support_type, keywords in support_keywords.items():
-            if any(keyword in message_lower for keyword in keywords):
-                extracted["support_type"] = support_type
-                break
+        if "support_type" in keywords:
+            extracted["support_type"] = keywords["support_type"]
         
         return extracted
     
+    def _match_keywords(self, message: str) -> Dict[str, Any]:
+        """메시지를 한 번 훑어 필드별 최우선 키워드 값 반환"""
+        best = {}
+        for match in KEYWORD_PATTERN.finditer(message):
+            for field, value, priority in KEYWORD_TAGS[match.group(1)]:
+                if field not in best or priority < best[field][1]:
+                    best[field] = (value, priority)
+        return {field: value for field, (value, _) in best.items()}
+    
     def get_next_question(self, user_profile: Dict, questions_asked: List[str]) -> Optional[QuestionMetadata]:
         """다음 질문 선택 - AI 기반 동적 선택"""
         
@@ -0,0 +1,42 @@
+"""
+API 키 인증
+"""
+
+import functools
+import hashlib
+import os
+from typing import Dict, FrozenSet, Optional, Tuple
+
+MIN_API_KEY_LENGTH = 8
+
+
+def _digest(api_key: str) -> bytes:
+    """API 키 다이제스트 - 원문 대신 해시로 비교해 타이밍 공격 방지"""
+    return hashlib.sha256(api_key.encode()).digest()
+
+
+@functools.lru_cache(maxsize=1)
+def _valid_key_digests(env_value: str) -> FrozenSet[bytes]:
+    """VALID_API_KEYS 값별로 한 번만 파싱 (환경변수가 바뀌면 자동으로 다시 파싱)"""
+    keys = (key.strip() for key in env_value.split(","))
+    return frozenset(_digest(key) for key in keys if len(key) >= MIN_API_KEY_LENGTH)
+
+
+def validate_api_key(api_key: Optional[str]) -> bool:
+    """API 키 유효성 검증"""
+    if not api_key or len(api_key) < MIN_API_KEY_LENGTH:
+        return False
+
+    return _digest(api_key) in _valid_key_digests(os.environ.get("VALID_API_KEYS", ""))
+
+
+def check_authorization(event: Dict) -> Tuple[bool, Optional[Dict]]:
+    """요청 인증 확인 - (인증 여부, 인증 정보) 반환"""
+    headers = event.get("headers") or {}
+    # REST API(v1)는 클라이언트가 보낸 대소문자 그대로 헤더를 전달하므로 대소문자 무시
+    api_key = next((value for name, value in headers.items() if name.lower() == "x-api-key"), None)
+
+    if validate_api_key(api_key):
+        return True, {"auth_type": "api_key"}
+
+    return False, None
@@ -5,59 +5,68 @@
 import hashlib
 import json
 import time
-from typing import Dict, Optional
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
 
 
 class PolicyCache:
-    """정책 매칭 결과 캐싱"""
+    """정책 매칭 결과 캐싱 (TTL + LRU)"""
 
-    def __init__(self, ttl_seconds: int = 3600):
+    def __init__(self, ttl_seconds: int = 3600, max_size: int = 10_000):
         self.ttl_seconds = ttl_seconds
-        self.cache: Dict[str, Dict] = {}
+        self.max_size = max_size
+        self._ttl_ns = ttl_seconds * 1_000_000_000
+        # key -> (result, 만료 시각 monotonic ns), 오래 사용하지 않은 항목이 앞쪽
+        self.cache: "OrderedDict[str, Tuple[Dict, int]]" = OrderedDict()
 
     def _generate_key(self, user_profile: Dict, policy_id: str) -> str:
         """캐시 키 생성 - 파티션 키 쏠림 방지"""
         # 사용자 ID가 있으면 우선 사용 (파티션 분산)
         user_id = user_profile.get("user_id", "")
         if not user_id:
-            # 프로필 해시로 대체
-            profile_str = json.dumps(user_profile, sort_keys=True)
-            user_id = hashlib.sha256(profile_str.encode()).hexdigest()[:8]
+            # 정규화된 프로필 자체를 식별자로 사용 (아래 해시 한 번으로 처리)
+            user_id = json.dumps(user_profile, sort_keys=True, separators=(",", ":"))
 
         # 시간 기반 prefix로 핫 파티션 방지
         time_prefix = str(int(time.time() // 3600))  # 시간별 분산
         key_data = f"{time_prefix}:{user_id}:{policy_id}"
-        return hashlib.sha256(key_data.encode()).hexdigest()
+        # 비암호용 인메모리 키이므로 SHA-256 대신 빠른 BLAKE2b 사용
+        return hashlib.blake2b(key_data.encode(), digest_size=16).hexdigest()
 
     def get(self, user_profile: Dict, policy_id: str) -> Optional[Dict]:
         """캐시에서 매칭 결과 조회"""
         key = self._generate_key(user_profile, policy_id)
 
-        if key not in self.cache:
+        item = self.cache.get(key)
+        if item is None:
             return None
 
-        cached_data = self.cache[key]
+        result, expires_at = item
 
-        # TTL 확인
-        if time.time() - cached_data["timestamp"] > self.ttl_seconds:
+        # TTL 확인 (벽시계 변경에 영향받지 않는 monotonic 시계 사용)
+        if time.monotonic_ns() > expires_at:
             del self.cache[key]
             return None
 
-        return cached_data["result"]
+        self.cache.move_to_end(key)
+        return result
 
     def set(self, user_profile: Dict, policy_id: str, result: Dict):
         """매칭 결과 캐싱"""
         key = self._generate_key(user_profile, policy_id)
 
-        self.cache[key] = {"result": result, "timestamp": time.time()}
+        self.cache[key] = (result, time.monotonic_ns() + self._ttl_ns)
+        self.cache.move_to_end(key)
+
+        # 최대 크기 초과 시 가장 오래 사용하지 않은 항목부터 제거
+        while len(self.cache) > self.max_size:
+            self.cache.popitem(last=False)
 
     def clear_expired(self):
         """만료된 캐시 정리"""
-        current_time = time.time()
+        current_time = time.monotonic_ns()
         expired_keys = [
-            key
-            for key, data in self.cache.items()
-            if current_time - data["timestamp"] > self.ttl_seconds
+            key for key, (_, expires_at) in self.cache.items() if current_time > expires_at
         ]
 
         for key in expired_keys:
@@ -1,49 +1,142 @@
 """Circuit Breaker pattern implementation"""
 
+import threading
 import time
-from enum import Enum
-from typing import Any, Callable
+from enum import IntEnum
+from typing import Any, Callable, Optional, Tuple
 
 
-class CircuitState(Enum):
-    CLOSED = "closed"
-    OPEN = "open"
-    HALF_OPEN = "half_open"
+class CircuitState(IntEnum):
+    CLOSED = 0
+    OPEN = 1
+    HALF_OPEN = 2
+
+
+# 핫 패스에서 enum 클래스 속성 조회를 피하기 위한 모듈 상수
+_CLOSED = CircuitState.CLOSED
+_OPEN = CircuitState.OPEN
+_HALF_OPEN = CircuitState.HALF_OPEN
+
+
+class CircuitBreakerOpenError(Exception):
+    """Raised when a call is rejected because the circuit is open"""
+
+
+# try_call이 회로가 열려 호출을 거부했을 때 반환하는 값
+CIRCUIT_OPEN = object()
 
 
 class CircuitBreaker:
-    def __init__(self, failure_threshold: int = 5, timeout: int = 60):
+    # 엔드포인트별 인스턴스의 __dict__ 제거 및 속성 접근을 고정 슬롯으로
+    __slots__ = (
+        "failure_threshold",
+        "timeout",
+        "timeout_ns",
+        "max_timeout_ns",
+        "open_timeout_ns",
+        "failure_count",
+        "last_failure_ns",
+        "open_until_ns",
+        "state",
+        "_probe_inflight",
+        "_lock",
+    )
+
+    def __init__(self, failure_threshold: int = 5, timeout: int = 60, max_timeout: int = 600):
         self.failure_threshold = failure_threshold
         self.timeout = timeout
+        self.timeout_ns = int(timeout * 1_000_000_000)
+        # 복구 시도(probe)가 실패할 때마다 OPEN 유지 시간을 두 배로 늘리되 상한 적용
+        self.max_timeout_ns = max(self.timeout_ns, int(max_timeout * 1_000_000_000))
+        self.open_timeout_ns = self.timeout_ns
         self.failure_count = 0
-        self.last_failure_time = None
-        self.state = CircuitState.CLOSED
+        self.last_failure_ns = 0
+        self.open_until_ns = 0  # OPEN 상태가 유지되는 시각 (이 시각 이후 probe 허용)
+        self.state = _CLOSED
+        self._probe_inflight = False
+        self._lock = threading.Lock()
 
     def call(self, func: Callable, *args, **kwargs) -> Any:
         """Execute function with circuit breaker protection"""
-        if self.state == CircuitState.OPEN:
-            if time.time() - self.last_failure_time > self.timeout:
-                self.state = CircuitState.HALF_OPEN
-            else:
-                raise Exception("Circuit breaker is OPEN")
+        ok, value = self.try_call(func, *args, **kwargs)
+        if ok:
+            return value
+        if value is CIRCUIT_OPEN:
+            raise CircuitBreakerOpenError("Circuit breaker is OPEN")
+        raise value
+
+    def try_call(self, func: Callable, *args, **kwargs) -> Tuple[bool, Any]:
+        """예외 없이 실행 - (성공 여부, 결과 / 발생한 예외 / CIRCUIT_OPEN) 반환"""
+        # CLOSED가 아닐 때만 상태 전이 확인 (정상 경로는 비교 한 번, 시계 조회 없음)
+        # 시계는 호출당 최대 한 번만 읽고 실패 기록에도 재사용
+        probe = False
+        now = 0
+        if self.state is not _CLOSED:
+            now = time.monotonic_ns()
+            probe = self._acquire_probe(now)
+            if probe is None:
+                return False, CIRCUIT_OPEN
 
         try:
             result = func(*args, **kwargs)
-            self._on_success()
-            return result
         except Exception as e:
-            self._on_failure()
-            raise e
+            self._on_failure(probe, now or time.monotonic_ns())
+            return False, e
+        except BaseException:
+            # 취소·인터럽트는 실패로 세지 않되 probe 자리는 반드시 반환 (다음 호출이 다시 확인)
+            if probe:
+                self._release_probe()
+            raise
+
+        if probe or self.failure_count:
+            self._on_success()
+        return True, result
+
+    def _acquire_probe(self, now: int) -> Optional[bool]:
+        """OPEN/HALF_OPEN 상태에서 복구 확인 요청 하나만 통과 (probe면 True, 거부면 None)"""
+        # 대기 시간이 남은 OPEN 상태는 미리 계산한 마감 시각과 한 번 비교해 잠금 없이 거부
+        if self.state is _OPEN and now <= self.open_until_ns:
+            return None
+
+        with self._lock:
+            if self.state is _OPEN and now > self.open_until_ns:
+                self.state = _HALF_OPEN
+                self._probe_inflight = False
+
+            if self.state is _CLOSED:
+                return False
+            if self.state is _OPEN or self._probe_inflight:
+                return None
+
+            self._probe_inflight = True
+            return True
+
+    def _release_probe(self):
+        """실행 중인 probe 표시 해제 (HALF_OPEN 유지)"""
+        with self._lock:
+            self._probe_inflight = False
 
     def _on_success(self):
         """Reset circuit breaker on success"""
-        self.failure_count = 0
-        self.state = CircuitState.CLOSED
+        with self._lock:
+            self.failure_count = 0
+            self.state = _CLOSED
+            self.open_timeout_ns = self.timeout_ns
+            self._probe_inflight = False
 
-    def _on_failure(self):
+    def _on_failure(self, probe: bool, now: int):
         """Handle failure"""
-        self.failure_count += 1
-        self.last_failure_time = time.time()
+        with self._lock:
+            self.failure_count += 1
+            self.last_failure_ns = now
+
+            if probe:
+                # 복구 확인 실패 - 대기 시간을 늘려 다시 OPEN
+                self.open_timeout_ns = min(self.open_timeout_ns * 2, self.max_timeout_ns)
+                self._probe_inflight = False
+                self.state = _OPEN
+            elif self.failure_count >= self.failure_threshold:
+                self.state = _OPEN
 
-        if self.failure_count >= self.failure_threshold:
-            self.state = CircuitState.OPEN
+            if self.state is _OPEN:
+                self.open_until_ns = now + self.open_timeout_ns
@@ -2,8 +2,28 @@
 모니터링 및 대시보드 구성
 """
 
+import atexit
 from typing import Dict
 
+# PutMetricData 한 번에 보낼 수 있는 메트릭 수
+MAX_METRICS_PER_REQUEST = 20
+
+_cloudwatch_client = None
+
+
+def _get_cloudwatch_client():
+    """CloudWatch 클라이언트 - Lambda 실행 환경이 유지되는 동안 재사용"""
+    global _cloudwatch_client
+    if _cloudwatch_client is None:
+        import boto3
+        from botocore.config import Config
+
+        _cloudwatch_client = boto3.client(
+            "cloudwatch",
+            config=Config(max_pool_connections=4, retries={"mode": "adaptive"}),
+        )
+    return _cloudwatch_client
+
 
 class MetricCollector:
     """CloudWatch 메트릭 수집기"""
@@ -26,16 +46,20 @@ class MetricCollector:
         if not self.metrics:
             return
 
+        sent = 0
         try:
-            import boto3
-
-            cloudwatch = boto3.client("cloudwatch")
+            cloudwatch = _get_cloudwatch_client()
 
-            # 배치로 메트릭 전송
-            cloudwatch.put_metric_data(Namespace="GovChat", MetricData=self.metrics)
+            # 호출당 최대 개수 단위로 나눠 배치 전송
+            for sent in range(0, len(self.metrics), MAX_METRICS_PER_REQUEST):
+                cloudwatch.put_metric_data(
+                    Namespace="GovChat",
+                    MetricData=self.metrics[sent : sent + MAX_METRICS_PER_REQUEST],
+                )
             self.metrics.clear()
         except Exception:
-            pass  # 메트릭 전송 실패해도 메인 로직에 영향 없음
+            # 메트릭 전송 실패해도 메인 로직에 영향 없음 (전송하지 못한 메트릭만 유지)
+            del self.metrics[:sent]
 
 
 def create_dashboard_config() -> Dict:
@@ -75,3 +99,6 @@ def create_dashboard_config() -> Dict:
 
 # 글로벌 메트릭 수집기
 metric_collector = MetricCollector()
+
+# 실행 환경 종료 시 남은 메트릭 전송
+atexit.register(metric_collector.flush_metrics)
@@ -4,6 +4,8 @@
 
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from typing import Dict, List
 
 
@@ -81,27 +83,36 @@ def create_log_insights_queries() -> Dict[str, str]:
 class HealthChecker:
     """서비스 헬스 체크"""
 
-    def __init__(self):
+    def __init__(self, timeout_seconds: float = 5.0, max_workers: int = 16):
         self.checks = []
+        self.timeout_seconds = timeout_seconds  # 전체 체크 대기 한도
+        self.max_workers = max_workers
+        # Lambda 실행 환경이 유지되는 동안 스레드 풀 재사용 (워커 스레드는 필요할 때만 생성)
+        self._executor = None
 
     def add_check(self, name: str, check_func):
         """헬스 체크 추가"""
         self.checks.append((name, check_func))
 
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="health-check")
+        return self._executor
+
     def run_checks(self) -> Dict:
-        """모든 헬스 체크 실행"""
+        """모든 헬스 체크 실행 - I/O 대기 체크들을 병렬로 실행해 가장 느린 체크 시간만큼만 소요"""
         results = {}
-        overall_healthy = True
-
-        for name, check_func in self.checks:
-            try:
-                result = check_func()
-                results[name] = {"status": "healthy" if result else "unhealthy", "details": result}
-                if not result:
-                    overall_healthy = False
-            except Exception as e:
-                results[name] = {"status": "error", "error": str(e)}
-                overall_healthy = False
+
+        if self.checks:
+            executor = self._get_executor()
+            futures = [(name, executor.submit(check_func)) for name, check_func in self.checks]
+            deadline = time.monotonic() + self.timeout_seconds
+            for name, future in futures:
+                results[name] = self._resolve(future, deadline)
+                # 응답 없는 체크는 기다리지 않음 (아직 시작 전이면 실행 취소)
+                future.cancel()
+
+        overall_healthy = all(result["status"] == "healthy" for result in results.values())
 
         return {
             "overall_status": "healthy" if overall_healthy else "unhealthy",
@@ -109,6 +120,24 @@ class HealthChecker:
             "timestamp": int(time.time()),
         }
 
+    def close(self):
+        """스레드 풀 정리 - 실행 중인 체크는 기다리지 않음"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    @staticmethod
+    def _resolve(future, deadline: float) -> Dict:
+        """체크 결과를 상태 dict로 변환"""
+        try:
+            result = future.result(timeout=max(0.0, deadline - time.monotonic()))
+        except FutureTimeoutError:
+            return {"status": "unhealthy", "error": "timeout"}
+        except Exception as e:
+            return {"status": "error", "error": str(e)}
+
+        return {"status": "healthy" if result else "unhealthy", "details": result}
+
 
 def check_opensearch_health() -> bool:
     """OpenSearch 헬스 체크"""
@@ -6,45 +6,60 @@ import time
 from typing import Dict
 
 
+# 토큰 1개 = 1e9 나노토큰 (경과 ns × 초당 요청 수가 곧 리필량이 되도록 정수 고정소수점 사용)
+_TOKEN = 1_000_000_000
+
+
 class RateLimiter:
     """토큰 버킷 기반 Rate Limiter"""
 
     def __init__(self, rate_limit: int = 50, burst_limit: int = 100):
         self.rate_limit = rate_limit  # 초당 요청 수
         self.burst_limit = burst_limit  # 버스트 허용량
-        self.tokens = burst_limit
-        self.last_refill = time.time()
+        self._capacity = burst_limit * _TOKEN
+        self._tokens = self._capacity  # 나노토큰 단위
+        self.last_refill = time.monotonic_ns()
+
+    @property
+    def tokens(self) -> float:
+        """현재 남은 토큰 수"""
+        return self._tokens / _TOKEN
 
     def allow_request(self) -> bool:
         """요청 허용 여부 확인"""
-        now = time.time()
+        now = time.monotonic_ns()
 
-        # 토큰 리필
-        elapsed = now - self.last_refill
-        self.tokens = min(self.burst_limit, self.tokens + elapsed * self.rate_limit)
+        # 토큰 리필 (정수 연산만 사용, 벽시계 변경에 영향받지 않음)
+        tokens = min(self._capacity, self._tokens + (now - self.last_refill) * self.rate_limit)
         self.last_refill = now
 
-        if self.tokens >= 1:
-            self.tokens -= 1
+        if tokens >= _TOKEN:
+            self._tokens = tokens - _TOKEN
             return True
+        self._tokens = tokens
         return False
 
 
-# 글로벌 Rate Limiter 인스턴스
-_rate_limiters: Dict[str, RateLimiter] = {}
+# 엔드포인트별 (초당 요청 수, 버스트 허용량)
+_ENDPOINT_LIMITS = {
+    "chat": (10, 20),
+    "search": (50, 100),
+    "question": (30, 60),
+    "match": (20, 40),
+    "extract": (15, 30),
+}
+
+# 글로벌 Rate Limiter 인스턴스 (알려진 엔드포인트는 import 시 미리 생성)
+_rate_limiters: Dict[str, RateLimiter] = {
+    endpoint: RateLimiter(rate_limit=rate, burst_limit=burst)
+    for endpoint, (rate, burst) in _ENDPOINT_LIMITS.items()
+}
 
 
 def get_rate_limiter(endpoint: str) -> RateLimiter:
     """엔드포인트별 Rate Limiter 반환"""
-    if endpoint not in _rate_limiters:
-        # 엔드포인트별 다른 제한
-        limits = {
-            "chat": RateLimiter(rate_limit=10, burst_limit=20),
-            "search": RateLimiter(rate_limit=50, burst_limit=100),
-            "question": RateLimiter(rate_limit=30, burst_limit=60),
-            "match": RateLimiter(rate_limit=20, burst_limit=40),
-            "extract": RateLimiter(rate_limit=15, burst_limit=30),
-        }
-        _rate_limiters[endpoint] = limits.get(endpoint, RateLimiter())
-
-    return _rate_limiters[endpoint]
+    limiter = _rate_limiters.get(endpoint)
+    if limiter is None:
+        # 그 외 엔드포인트는 기본 제한으로 각자 버킷 사용
+        limiter = _rate_limiters.setdefault(endpoint, RateLimiter())
+    return limiter
@@ -30,10 +30,15 @@ except ImportError:
 logger = setup_logger(__name__)
 conversation_engine = ConversationEngine()
 
+# 단순 질문 생성 모드 요청에 반드시 있는 키 (기존 question API 호환)
+_SIMPLE_MODE_KEYS = frozenset({"policyText", "userProfile"})
+
 def handler(event, context):
     """통합 챗봇 핸들러"""
     try:
-
+        # 직접 호출(다른 Lambda, 테스트)에서 이미 파싱된 dict를 넘기면 JSON 변환 생략
+        raw_body = event.get("body") or "{}"
+        body = raw_body if isinstance(raw_body, dict) else json.loads(raw_body)
         
         # API 레지스트리 요청 처리
         if body.get('action') == 'auto_register':
@@ -43,7 +48,7 @@ def handler(event, context):
         logger.info("Chatbot request received", extra={"body_keys": list(body.keys())})
         
         # 단순 질문 생성 모드
-        if "policyText" in body and "userProfile" in body:
+        if body.keys() >= _SIMPLE_MODE_KEYS:
             return handle_simple_question(body)
         
         # 대화형 모드 - AI 기반 지능형 대화
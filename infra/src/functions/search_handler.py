@@ -25,6 +25,30 @@ except ImportError:
 
 logger = Logger()
 
+# 한 요청에서 처리하는 최대 검색어 수 (Lambda 실행 시간 보호)
+MAX_BATCH_QUERIES = 20
+
+def _bad_request(error, **extra):
+    """400 응답 생성"""
+    return {
+        'statusCode': 400,
+        'headers': {
+            'Content-Type': 'application/json',
+            'Access-Control-Allow-Origin': '*'
+        },
+        'body': json.dumps({'error': error, **extra}, ensure_ascii=False)
+    }
+
+def _validate_queries(queries):
+    """queries 배열 검증 - 오류 메시지 반환 (정상이면 None)"""
+    if not isinstance(queries, list) or not queries:
+        return 'queries는 검색어 배열이어야 합니다'
+    if len(queries) > MAX_BATCH_QUERIES:
+        return f'queries는 최대 {MAX_BATCH_QUERIES}개까지 가능합니다'
+    if not all(isinstance(q, str) and q.strip() for q in queries):
+        return 'queries의 각 항목은 비어 있지 않은 문자열이어야 합니다'
+    return None
+
 def handler(event, context):
     """검색 Lambda 핸들러"""
     try:
@@ -32,23 +56,20 @@ def handler(event, context):
         query_params = event.get('queryStringParameters') or {}
         query = query_params.get('q', '')
         
-        # POST 요청의 body도 지원
+        # POST 요청의 body도 지원 (queries 배열로 여러 검색어를 한 번에 처리)
         if not query and event.get('body'):
             body = json.loads(event.get('body', '{}'))
             query = body.get('q', '')
+            
+            if 'queries' in body:
+                queries = body['queries']
+                error = _validate_queries(queries)
+                if error:
+                    return _bad_request(error)
+                return handle_batch_search(queries)
         
         if not query:
-            return {
-                'statusCode': 400,
-                'headers': {
-                    'Content-Type': 'application/json',
-                    'Access-Control-Allow-Origin': '*'
-                },
-                'body': json.dumps({
-                    'error': '검색어(q)가 필요합니다',
-                    'example': '/search?q=창업지원'
-                }, ensure_ascii=False)
-            }
+            return _bad_request('검색어(q)가 필요합니다', example='/search?q=창업지원')
         
         logger.info("Search request", extra={"query": query, "method": event.get('httpMethod')})
         
@@ -86,6 +107,32 @@ def handler(event, context):
             }, ensure_ascii=False)
         }
 
+def handle_batch_search(queries):
+    """여러 검색어를 한 번의 요청으로 처리"""
+    logger.info("Batch search request", extra={"query_count": len(queries)})
+    
+    batch_results = []
+    for query in queries:
+        results = perform_vector_search(query) or get_fallback_results(query)
+        batch_results.append({
+            'query': query,
+            'results': results,
+            'total': len(results)
+        })
+    
+    return {
+        'statusCode': 200,
+        'headers': {
+            'Content-Type': 'application/json',
+            'Access-Control-Allow-Origin': '*'
+        },
+        'body': json.dumps({
+            'results': batch_results,
+            'total': len(batch_results),
+            'search_type': 'vector_search'
+        }, ensure_ascii=False)
+    }
+
 def perform_vector_search(query):
     """벡터 검색 수행 (간단 버전)"""
     try:
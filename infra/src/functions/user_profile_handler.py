@@ -34,6 +34,11 @@ USER_PROFILE_SCHEMA = {
     "additionalProperties": False,
 }
 
+# 스키마 검사·검증기 생성은 import 시 한 번만 수행 (jsonschema.validate는 호출마다 반복)
+_USER_PROFILE_VALIDATOR_CLASS = jsonschema.validators.validator_for(USER_PROFILE_SCHEMA)
+_USER_PROFILE_VALIDATOR_CLASS.check_schema(USER_PROFILE_SCHEMA)
+USER_PROFILE_VALIDATOR = _USER_PROFILE_VALIDATOR_CLASS(USER_PROFILE_SCHEMA)
+
 
 @tracer.capture_lambda_handler
 @logger.inject_lambda_context(correlation_id_path=correlation_paths.API_GATEWAY_REST)
@@ -105,13 +110,12 @@ def _update_profile(user_id: str, body: str, headers: dict):
         profile_data = json.loads(body)
 
         # 입력 검증
-        try:
-            jsonschema.validate(profile_data, USER_PROFILE_SCHEMA)
-        except jsonschema.ValidationError as e:
+        error = jsonschema.exceptions.best_match(USER_PROFILE_VALIDATOR.iter_errors(profile_data))
+        if error is not None:
             return {
                 "statusCode": 400,
                 "headers": headers,
-                "body": json.dumps({"error": f"Invalid profile data: {e.message}"}),
+                "body": json.dumps({"error": f"Invalid profile data: {error.message}"}),
             }
 
         # 입력 sanitization
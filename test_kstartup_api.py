@@ -6,20 +6,33 @@ K-Startup API 테스트 스크립트
 import requests
 import json
 
+SERVICE_KEY = "0259O7/MNmML1Vc3Q2zGYep/IdldHAOqicKRLBU4TllZmDrPwGdRMZas3F4ZIA0ccVHIv/dxa+UvOzEtsxCRzA=="
+
+# 방법 1: 전체 URL (모듈 로드 시 한 번만 생성)
+URLS_TO_TEST = (
+    f"https://nidapi.k-startup.go.kr/api/kisedKstartupService/v1/getBusinessInformation/{SERVICE_KEY}",
+    f"https://nidapi.k-startup.go.kr/api/kisedKstartupService/v1/getBusinessInformation?serviceKey={SERVICE_KEY}",
+    f"https://nidapi.k-startup.go.kr/api/kisedKstartupService/getBusinessInformation?serviceKey={SERVICE_KEY}",
+    f"https://api.k-startup.go.kr/api/kisedKstartupService/v1/getBusinessInformation?serviceKey={SERVICE_KEY}",
+)
+
+# 방법 2: 다른 엔드포인트 (엔드포인트, 요청 URL)
+OTHER_ENDPOINTS = tuple(
+    (endpoint, f"{endpoint}?serviceKey={SERVICE_KEY}")
+    for endpoint in (
+        "https://nidapi.k-startup.go.kr/api/kisedKstartupService/v1/getBizInfo",
+        "https://nidapi.k-startup.go.kr/api/kisedKstartupService/getBizInfo",
+        "https://api.k-startup.go.kr/openapi/service/rest/getBizInfo",
+    )
+)
+
 def test_kstartup_api():
     """K-Startup API 다양한 방식으로 테스트"""
     
     # 방법 1: 전체 URL
     print("🔍 K-Startup API 테스트 시작...")
     
-    urls_to_test = [
-        "https://nidapi.k-startup.go.kr/api/kisedKstartupService/v1/getBusinessInformation/0259O7/MNmML1Vc3Q2zGYep/IdldHAOqicKRLBU4TllZmDrPwGdRMZas3F4ZIA0ccVHIv/dxa+UvOzEtsxCRzA==",
-        "https://nidapi.k-startup.go.kr/api/kisedKstartupService/v1/getBusinessInformation?serviceKey=0259O7/MNmML1Vc3Q2zGYep/IdldHAOqicKRLBU4TllZmDrPwGdRMZas3F4ZIA0ccVHIv/dxa+UvOzEtsxCRzA==",
-        "https://nidapi.k-startup.go.kr/api/kisedKstartupService/getBusinessInformation?serviceKey=0259O7/MNmML1Vc3Q2zGYep/IdldHAOqicKRLBU4TllZmDrPwGdRMZas3F4ZIA0ccVHIv/dxa+UvOzEtsxCRzA==",
-        "https://api.k-startup.go.kr/api/kisedKstartupService/v1/getBusinessInformation?serviceKey=0259O7/MNmML1Vc3Q2zGYep/IdldHAOqicKRLBU4TllZmDrPwGdRMZas3F4ZIA0ccVHIv/dxa+UvOzEtsxCRzA=="
-    ]
-    
-    for i, url in enumerate(urls_to_test, 1):
+    for i, url in enumerate(URLS_TO_TEST, 1):
         print(f"\n📡 테스트 {i}: {url[:80]}...")
         
         try:
@@ -43,18 +56,10 @@ def test_kstartup_api():
     # 방법 2: 다른 엔드포인트 시도
     print(f"\n🔍 다른 K-Startup 엔드포인트 테스트...")
     
-    other_endpoints = [
-        "https://nidapi.k-startup.go.kr/api/kisedKstartupService/v1/getBizInfo",
-        "https://nidapi.k-startup.go.kr/api/kisedKstartupService/getBizInfo",
-        "https://api.k-startup.go.kr/openapi/service/rest/getBizInfo"
-    ]
-    
-    service_key = "0259O7/MNmML1Vc3Q2zGYep/IdldHAOqicKRLBU4TllZmDrPwGdRMZas3F4ZIA0ccVHIv/dxa+UvOzEtsxCRzA=="
-    
-    for endpoint in other_endpoints:
+    for endpoint, url in OTHER_ENDPOINTS:
         print(f"\n📡 테스트: {endpoint}")
         try:
-            response = requests.get(f"{endpoint}?serviceKey={service_key}", timeout=10)
+            response = requests.get(url, timeout=10)
             print(f"   상태: {response.status_code}")
             print(f"   응답: {response.text[:100]}...")
         except Exception as e:
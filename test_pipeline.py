@@ -53,23 +53,23 @@ def test_vector_search():
         "주거 지원 사업"
     ]
     
-    for query in test_queries:
-        try:
-            response = requests.get(f"{BASE_URL}/search", params={"q": query}, timeout=30)
-            
-            if response.status_code == 200:
-                data = response.json()
-                print(f"✅ '{query}' 검색 성공")
+    try:
+        # 모든 검색어를 한 번의 요청으로 전송
+        response = requests.post(f"{BASE_URL}/search", json={"queries": test_queries}, timeout=30)
+        
+        if response.status_code == 200:
+            for data in response.json().get('results', []):
+                print(f"✅ '{data.get('query', '')}' 검색 성공")
                 print(f"   - 결과 수: {data.get('total', 0)}")
                 
                 for i, result in enumerate(data.get('results', [])[:2]):
                     print(f"   {i+1}. {result.get('title', '')}")
                     print(f"      점수: {result.get('score', 0):.3f}")
-            else:
-                print(f"❌ '{query}' 검색 실패: {response.status_code}")
-                
-        except Exception as e:
-            print(f"❌ '{query}' 검색 오류: {e}")
+        else:
+            print(f"❌ 검색 실패: {response.status_code}")
+            
+    except Exception as e:
+        print(f"❌ 검색 오류: {e}")
 
 def test_external_search():
     """외부 API 검색 테스트"""
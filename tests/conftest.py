@@ -0,0 +1,54 @@
+"""Shared pytest fixtures"""
+import pathlib
+import sys
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+# 테스트 모듈마다 sys.path를 수정하지 않고 수집 시 한 번만 등록
+# (infra: src.*, infra/src: common.*/functions.* import 용)
+# (infra/src에는 vendored 라이브러리가 있으므로 site-packages보다 뒤에 둠)
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+for path in (str(ROOT / "infra"), str(ROOT / "infra" / "src")):
+    if path not in sys.path:
+        sys.path.append(path)
+
+
+@pytest.fixture
+def admin_tables(monkeypatch):
+    """Replace admin_handler DynamoDB tables with a single set of MagicMocks"""
+    import functions.admin_handler as admin_handler
+
+    tables = {
+        'projects_table': MagicMock(),
+        'admin_logs_table': MagicMock(),
+    }
+    for name, table in tables.items():
+        monkeypatch.setattr(admin_handler, name, table)
+
+    return tables
+
+
+@pytest.fixture(scope="session")
+def auth_tokens():
+    """Role별 테스트 JWT (세션당 한 번만 서명 - 긴 테스트 실행에도 만료되지 않도록 1시간 유효)"""
+    import jwt
+
+    def encode(role):
+        payload = {
+            "email": f"{role}@test.com",
+            "role": role,
+            "exp": datetime.utcnow() + timedelta(hours=1)
+        }
+        return jwt.encode(payload, "test-secret", algorithm="HS256")
+
+    return {role: encode(role) for role in ("user", "admin")}
+
+
+@pytest.fixture(scope="session")
+def chatbot_handler():
+    """챗봇 핸들러 - 세션(xdist 워커)당 한 번만 import·초기화"""
+    from src.functions.chatbot_handler import handler
+
+    return handler
@@ -3,23 +3,20 @@
 """
 
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import DEFAULT, Mock, patch
 import json
-import sys
-import os
-
-sys.path.append(os.path.join(os.path.dirname(__file__), '../infra/src'))
 
 from functions.admin_handler import handler, _create_project, _update_project, _delete_project
 
 
+@pytest.mark.usefixtures('admin_tables')
+@patch.multiple('functions.admin_handler', verify_admin_token=DEFAULT)
 class TestAdminFunctions:
     """관리자 기능 테스트"""
     
-    @patch('functions.admin_handler.verify_admin_token')
-    @patch('functions.admin_handler.projects_table')
-    def test_create_project_success(self, mock_table, mock_verify):
+    def test_create_project_success(self, admin_tables, **mocks):
         """프로젝트 생성 성공 테스트"""
+        mock_table, mock_verify = admin_tables['projects_table'], mocks['verify_admin_token']
         mock_verify.return_value = {
             "valid": True,
             "user": {"email": "admin@test.com", "role": "admin"}
@@ -43,9 +40,9 @@ class TestAdminFunctions:
         body = json.loads(response["body"])
         assert "성공적으로 생성" in body["message"]
     
-    @patch('functions.admin_handler.verify_admin_token')
-    def test_create_project_unauthorized(self, mock_verify):
+    def test_create_project_unauthorized(self, **mocks):
         """권한 없는 프로젝트 생성 시도 테스트"""
+        mock_verify = mocks['verify_admin_token']
         mock_verify.return_value = {"valid": False, "error": "권한 없음"}
         
         event = {
@@ -59,10 +56,9 @@ class TestAdminFunctions:
         
         assert response["statusCode"] == 403
     
-    @patch('functions.admin_handler.verify_admin_token')
-    @patch('functions.admin_handler.projects_table')
-    def test_update_project_success(self, mock_table, mock_verify):
+    def test_update_project_success(self, admin_tables, **mocks):
         """프로젝트 수정 성공 테스트"""
+        mock_table, mock_verify = admin_tables['projects_table'], mocks['verify_admin_token']
         mock_verify.return_value = {
             "valid": True,
             "user": {"email": "admin@test.com", "role": "admin"}
@@ -82,10 +78,9 @@ class TestAdminFunctions:
         
         assert response["statusCode"] == 200
     
-    @patch('functions.admin_handler.verify_admin_token')
-    @patch('functions.admin_handler.projects_table')
-    def test_delete_project_success(self, mock_table, mock_verify):
+    def test_delete_project_success(self, admin_tables, **mocks):
         """프로젝트 삭제 성공 테스트"""
+        mock_table, mock_verify = admin_tables['projects_table'], mocks['verify_admin_token']
         mock_verify.return_value = {
             "valid": True,
             "user": {"email": "admin@test.com", "role": "admin"}
@@ -106,10 +101,9 @@ class TestAdminFunctions:
         # 소프트 삭제 확인
         mock_table.update_item.assert_called_once()
     
-    @patch('functions.admin_handler.verify_admin_token')
-    @patch('functions.admin_handler.admin_logs_table')
-    def test_get_admin_logs(self, mock_logs_table, mock_verify):
+    def test_get_admin_logs(self, admin_tables, **mocks):
         """관리자 로그 조회 테스트"""
+        mock_logs_table, mock_verify = admin_tables['admin_logs_table'], mocks['verify_admin_token']
         mock_verify.return_value = {
             "valid": True,
             "user": {"email": "admin@test.com", "role": "admin"}
@@ -138,7 +132,7 @@ class TestAdminFunctions:
         body = json.loads(response["body"])
         assert len(body["logs"]) == 1
     
-    def test_input_sanitization(self):
+    def test_input_sanitization(self, **mocks):
         """입력 데이터 정제 테스트"""
         from common.xss_protection import sanitize_input
         
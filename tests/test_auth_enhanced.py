@@ -5,12 +5,8 @@
 import pytest
 import bcrypt
 import jwt
-from datetime import datetime, timedelta
+from datetime import datetime
 from unittest.mock import Mock, patch
-import sys
-import os
-
-sys.path.append(os.path.join(os.path.dirname(__file__), '../infra/src'))
 
 from functions.user_auth_handler import handler, _generate_jwt
 from common.api_auth import verify_token, verify_admin_token
@@ -60,46 +56,30 @@ class TestAuthEnhanced:
             assert (exp_time - now).total_seconds() <= 900
     
     @patch('common.api_auth.ssm')
-    def test_token_verification(self, mock_ssm):
+    def test_token_verification(self, mock_ssm, auth_tokens):
         """토큰 검증 테스트"""
         mock_ssm.get_parameter.return_value = {'Parameter': {'Value': 'test-secret'}}
         
         # 유효한 토큰
-        payload = {
-            "email": "test@test.com",
-            "role": "user",
-            "exp": datetime.utcnow() + timedelta(minutes=15)
-        }
-        token = jwt.encode(payload, "test-secret", algorithm="HS256")
-        
-        headers = {"Authorization": f"Bearer {token}"}
+        headers = {"Authorization": f"Bearer {auth_tokens['user']}"}
         result = verify_token(headers)
         
         assert result["valid"] is True
-        assert result["user"]["email"] == "test@test.com"
+        assert result["user"]["email"] == "user@test.com"
     
     @patch('common.api_auth.ssm')
-    def test_admin_token_verification(self, mock_ssm):
+    def test_admin_token_verification(self, mock_ssm, auth_tokens):
         """관리자 토큰 검증 테스트"""
         mock_ssm.get_parameter.return_value = {'Parameter': {'Value': 'test-secret'}}
         
         # 관리자 토큰
-        payload = {
-            "email": "admin@test.com",
-            "role": "admin",
-            "exp": datetime.utcnow() + timedelta(minutes=15)
-        }
-        token = jwt.encode(payload, "test-secret", algorithm="HS256")
-        
-        headers = {"Authorization": f"Bearer {token}"}
+        headers = {"Authorization": f"Bearer {auth_tokens['admin']}"}
         result = verify_admin_token(headers)
         
         assert result["valid"] is True
         
         # 일반 사용자 토큰으로 관리자 검증 시도
-        payload["role"] = "user"
-        user_token = jwt.encode(payload, "test-secret", algorithm="HS256")
-        headers = {"Authorization": f"Bearer {user_token}"}
+        headers = {"Authorization": f"Bearer {auth_tokens['user']}"}
         result = verify_admin_token(headers)
         
         assert result["valid"] is False
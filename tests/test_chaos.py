@@ -24,7 +24,7 @@ class ChaosTestSuite:
             mock_resource.return_value.Table.return_value = mock_table
 
             # 캐시 모듈 테스트
-            from infra.src.common.cache_strategy import DynamoDBCache
+            from src.common.cache_strategy import DynamoDBCache
 
             cache = DynamoDBCache("test-table")
 
@@ -43,7 +43,7 @@ class ChaosTestSuite:
     def simulate_lambda_cold_start(self):
         """Lambda Cold Start 시뮬레이션"""
         # 메모리 캐시 초기화 상황 테스트
-        from infra.src.common.cache_strategy import policy_cache
+        from src.common.cache_strategy import policy_cache
 
         # 캐시 초기화
         policy_cache.cache.clear()
@@ -105,50 +105,52 @@ def test_high_concurrency_resilience(chaos_suite):
     chaos_suite.simulate_high_concurrency()
 
 
-class CircuitBreakerTest:
+class TestCircuitBreakerChaos:
     """Circuit Breaker 동작 테스트"""
 
+    @staticmethod
+    def _fail():
+        raise RuntimeError("Service failure")
+
     def test_circuit_breaker_open(self):
         """Circuit Breaker OPEN 상태 테스트"""
-        from infra.src.common.circuit_breaker import CircuitBreaker
+        from src.common.circuit_breaker import CircuitBreaker, CircuitBreakerOpenError, CircuitState
 
         cb = CircuitBreaker(failure_threshold=3, timeout=5)
 
         # 연속 실패로 OPEN 상태 유도
-        for _ in range(4):
-            with pytest.raises(Exception):
-                with cb:
-                    raise Exception("Service failure")
+        for _ in range(cb.failure_threshold):
+            with pytest.raises(RuntimeError):
+                cb.call(self._fail)
 
         # OPEN 상태에서 즉시 실패 확인
-        assert cb.state == "OPEN"
+        assert cb.state is CircuitState.OPEN
 
-        with pytest.raises(Exception):
-            with cb:
-                pass  # 실행되지 않아야 함
+        service = MagicMock()
+        with pytest.raises(CircuitBreakerOpenError):
+            cb.call(service)
+        service.assert_not_called()  # 실행되지 않아야 함
 
     def test_circuit_breaker_half_open(self):
         """Circuit Breaker HALF_OPEN 상태 테스트"""
-        from infra.src.common.circuit_breaker import CircuitBreaker
+        from src.common.circuit_breaker import CircuitBreaker, CircuitState
 
         cb = CircuitBreaker(failure_threshold=2, timeout=1)
 
         # OPEN 상태로 전환
-        for _ in range(3):
-            try:
-                with cb:
-                    raise Exception("Failure")
-            except:
-                pass
+        for _ in range(cb.failure_threshold):
+            with pytest.raises(RuntimeError):
+                cb.call(self._fail)
+        assert cb.state is CircuitState.OPEN
 
-        # 타임아웃 대기
-        time.sleep(1.1)
+        # 타임아웃 경과 (실제 대기 대신 시계를 앞당김)
+        with patch("src.common.circuit_breaker.time") as mock_time:
+            mock_time.monotonic_ns.return_value = time.monotonic_ns() + 1_100_000_000
 
-        # HALF_OPEN 상태에서 성공 시 CLOSED로 복구
-        with cb:
-            pass  # 성공
+            # HALF_OPEN 상태에서 성공 시 CLOSED로 복구
+            assert cb.call(lambda: "ok") == "ok"
 
-        assert cb.state == "CLOSED"
+        assert cb.state is CircuitState.CLOSED
 
 
 def test_memory_leak_detection():
@@ -161,7 +163,7 @@ def test_memory_leak_detection():
     initial_memory = process.memory_info().rss
 
     # 대량 캐시 작업 수행
-    from infra.src.common.cache_strategy import policy_cache
+    from src.common.cache_strategy import policy_cache
 
     for i in range(1000):
         user_profile = {"id": i, "data": "x" * 100}
@@ -177,7 +179,7 @@ def test_memory_leak_detection():
 
 def test_error_rate_monitoring():
     """에러율 모니터링 테스트"""
-    from infra.src.common.metrics_collector import metric_collector
+    from src.common.metrics_collector import metric_collector
 
     # 에러 시뮬레이션
     total_requests = 100
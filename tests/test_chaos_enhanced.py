@@ -1,8 +1,9 @@
 """Enhanced chaos engineering tests with circuit breaker validation"""
+import json
 import pytest
 import time
 from unittest.mock import patch, MagicMock
-from src.common.circuit_breaker import CircuitBreaker
+from src.common.circuit_breaker import CircuitBreaker, CircuitBreakerOpenError, CircuitState
 from opensearchpy.exceptions import ConnectionTimeout, ConnectionError
 
 
@@ -11,31 +12,23 @@ class TestChaosEngineering:
     
     def test_opensearch_timeout_triggers_circuit_breaker(self):
         """Test that OpenSearch timeout opens circuit breaker"""
-        circuit_breaker = CircuitBreaker(
-            failure_threshold=3,
-            recovery_timeout=60,
-            expected_exception=ConnectionTimeout
-        )
+        circuit_breaker = CircuitBreaker(failure_threshold=3, timeout=60)
         
-        # Mock OpenSearch client that always times out
+        # Mock OpenSearch client that times out up to the threshold
         mock_client = MagicMock()
-        mock_client.search.side_effect = ConnectionTimeout("Connection timeout")
+        mock_client.search.side_effect = [ConnectionTimeout("Connection timeout")] * 3
         
-        # Simulate multiple failures to trigger circuit breaker
-        for i in range(4):  # One more than threshold
-            try:
-                with circuit_breaker:
-                    mock_client.search(index="test", body={})
-            except (ConnectionTimeout, Exception):
-                pass
+        # Simulate exactly threshold failures to trigger circuit breaker
+        for _ in range(3):
+            with pytest.raises(ConnectionTimeout):
+                circuit_breaker.call(mock_client.search, index="test", body={})
         
         # Circuit should now be open
-        assert circuit_breaker.state == "OPEN"
+        assert circuit_breaker.state is CircuitState.OPEN
         
         # Next call should fail fast without calling OpenSearch
-        with pytest.raises(Exception, match="Circuit breaker is OPEN"):
-            with circuit_breaker:
-                mock_client.search(index="test", body={})
+        with pytest.raises(CircuitBreakerOpenError):
+            circuit_breaker.call(mock_client.search, index="test", body={})
         
         # Verify OpenSearch wasn't called for the last attempt
         assert mock_client.search.call_count == 3  # Only the first 3 attempts
@@ -128,27 +121,41 @@ class TestChaosEngineering:
                 
             assert fallback_response["status"] == "degraded"
             
-    def test_memory_pressure_simulation(self):
+    def test_memory_pressure_simulation(self, chatbot_handler):
         """Test behavior under memory pressure"""
-        import gc
+        resource = pytest.importorskip("resource")  # Not available on Windows
         
-        # Simulate memory pressure by creating large objects
-        large_objects = []
+        # Cap the address space just above current usage instead of actually filling memory
         try:
-            # Create objects until memory pressure
-            for i in range(1000):
-                large_objects.append([0] * 10000)  # 10k integers each
-                
-            # Force garbage collection
-            gc.collect()
+            with open("/proc/self/status") as status:
+                vm_kb = next(int(line.split()[1]) for line in status if line.startswith("VmSize:"))
+        except (OSError, StopIteration):
+            pytest.skip("address space size not available")
+        
+        headroom = 64 * 1024 * 1024
+        soft, hard = resource.getrlimit(resource.RLIMIT_AS)
+        cap = vm_kb * 1024 + headroom
+        if hard != resource.RLIM_INFINITY and cap > hard:
+            pytest.skip("hard RLIMIT_AS too low")
+        
+        event = {"body": json.dumps({"message": "안녕하세요", "session_id": "memory_pressure"})}
+        
+        try:
+            resource.setrlimit(resource.RLIMIT_AS, (cap, hard))
             
-            # Verify system still responds
-            assert len(large_objects) > 0
+            # Allocation beyond the cap must fail cleanly
+            with pytest.raises(MemoryError):
+                bytearray(2 * headroom)
             
+            # The handler must still serve requests inside the limited window
+            response = chatbot_handler(event, {})
         finally:
-            # Clean up
-            large_objects.clear()
-            gc.collect()
+            resource.setrlimit(resource.RLIMIT_AS, (soft, hard))
+        
+        assert response["statusCode"] == 200
+        body = json.loads(response["body"])
+        assert body["type"] == "consent"
+        assert body["session_id"] == "memory_pressure"
     
     def test_concurrent_request_overload(self):
         """Test system behavior under concurrent request overload"""
@@ -3,58 +3,8 @@
 """
 
 import json
-import os
-import sys
-
-sys.path.append(os.path.join(os.path.dirname(__file__), "..", "infra", "src"))
-
-try:
-    from chatbot.conversation_engine import ConversationEngine, QuestionMetadata
-except ImportError:
-    # 기본 클래스 정의
-    class QuestionMetadata:
-        def __init__(self, field, question, options=None, sensitivity=0.5, requires_consent=False):
-            self.field = field
-            self.question = question
-            self.options = options or []
-            self.sensitivity = sensitivity
-            self.requires_consent = requires_consent
-    
-    class ConversationEngine:
-        def __init__(self):
-            self.question_bank = [
-                QuestionMetadata("region", "거주 지역을 알려주세요", ["서울", "경기", "인천"]),
-                QuestionMetadata("age_group", "연령대를 알려주세요", ["20대", "30대", "40대"]),
-                QuestionMetadata("tax_status", "세금 상태", [], 0.9, True)
-            ]
-        
-        def extract_user_info(self, message, current_profile):
-            extracted = current_profile.copy()
-            if "서울" in message:
-                extracted["region"] = "서울"
-            if "20대" in message:
-                extracted["age_group"] = "20대"
-            if "30대" in message:
-                extracted["age_group"] = "30대"
-            # 더 구체적인 문자열을 먼저 체크
-            if "사업자등록" in message:
-                print(f"DEBUG: message='{message}'")
-                print(f"DEBUG: '안되어있' in message: {'안되어있' in message}")
-                print(f"DEBUG: '되어있' in message: {'되어있' in message}")
-                if "안되어있" in message:
-                    extracted["business_status"] = "아니오"
-                    print("DEBUG: Set to 아니오")
-                elif "되어있" in message:
-                    extracted["business_status"] = "예"
-                    print("DEBUG: Set to 예")
-            return extracted
-        
-        def get_next_question(self, user_profile, questions_asked):
-            for q in self.question_bank:
-                if q.field not in questions_asked and q.field not in user_profile:
-                    return q
-            return None
 
+from chatbot.conversation_engine import ConversationEngine, QuestionMetadata
 from functions.chatbot_handler import handler as chatbot_handler
 
 
@@ -3,24 +3,45 @@
 """
 
 import pytest
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock
 import json
-import sys
-import os
-
-sys.path.append(os.path.join(os.path.dirname(__file__), '../infra/src'))
 
 from functions.external_data_sync_handler import handler, _fetch_external_policies, _upsert_policy
 
+MODULE = 'functions.external_data_sync_handler'
+
+
+@pytest.fixture(scope="module", autouse=True)
+def ext_mocks():
+    """외부 의존성을 모듈 전체에서 한 번만 Mock으로 교체"""
+    mocks = SimpleNamespace(
+        requests=Mock(),
+        ssm=Mock(),
+        projects_table=Mock(),
+        sync_policies_by_keyword=Mock(),
+    )
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(f'{MODULE}.requests', mocks.requests)
+        mp.setattr(f'{MODULE}.ssm', mocks.ssm)
+        mp.setattr(f'{MODULE}.projects_table', mocks.projects_table)
+        mp.setattr(f'{MODULE}._sync_policies_by_keyword', mocks.sync_policies_by_keyword)
+        yield mocks
+
+
+@pytest.fixture(autouse=True)
+def _reset_ext_mocks(ext_mocks):
+    """테스트 간 호출 기록·반환값이 섞이지 않도록 초기화"""
+    for mock in vars(ext_mocks).values():
+        mock.reset_mock(return_value=True, side_effect=True)
+
 
 class TestExternalData:
     """외부 데이터 연동 테스트"""
     
-    @patch('functions.external_data_sync_handler.requests')
-    @patch('functions.external_data_sync_handler.ssm')
-    def test_fetch_external_policies_success(self, mock_ssm, mock_requests):
+    def test_fetch_external_policies_success(self, ext_mocks):
         """외부 API 데이터 가져오기 성공 테스트"""
-        mock_ssm.get_parameter.return_value = {'Parameter': {'Value': 'test-api-key'}}
+        ext_mocks.ssm.get_parameter.return_value = {'Parameter': {'Value': 'test-api-key'}}
         
         mock_response = Mock()
         mock_response.json.return_value = {
@@ -37,18 +58,16 @@ class TestExternalData:
                 }
             }
         }
-        mock_requests.get.return_value = mock_response
+        ext_mocks.requests.get.return_value = mock_response
         
         result = _fetch_external_policies("청년")
         
         assert len(result) == 1
         assert result[0]["policyId"] == "P001"
     
-    @patch('functions.external_data_sync_handler.requests')
-    @patch('functions.external_data_sync_handler.ssm')
-    def test_fetch_external_policies_api_error(self, mock_ssm, mock_requests):
+    def test_fetch_external_policies_api_error(self, ext_mocks):
         """외부 API 오류 테스트"""
-        mock_ssm.get_parameter.return_value = {'Parameter': {'Value': 'test-api-key'}}
+        ext_mocks.ssm.get_parameter.return_value = {'Parameter': {'Value': 'test-api-key'}}
         
         mock_response = Mock()
         mock_response.json.return_value = {
@@ -56,16 +75,15 @@ class TestExternalData:
                 "header": {"resultCode": "99", "resultMsg": "API Error"}
             }
         }
-        mock_requests.get.return_value = mock_response
+        ext_mocks.requests.get.return_value = mock_response
         
         with pytest.raises(Exception, match="API Error"):
             _fetch_external_policies("청년")
     
-    @patch('functions.external_data_sync_handler.projects_table')
-    def test_upsert_policy_insert(self, mock_table):
+    def test_upsert_policy_insert(self, ext_mocks):
         """정책 데이터 삽입 테스트"""
-        mock_table.get_item.return_value = {}
-        mock_table.put_item.return_value = {}
+        ext_mocks.projects_table.get_item.return_value = {}
+        ext_mocks.projects_table.put_item.return_value = {}
         
         policy_data = {
             "policyId": "P001",
@@ -76,13 +94,12 @@ class TestExternalData:
         result = _upsert_policy(policy_data)
         
         assert result == "insert"
-        mock_table.put_item.assert_called_once()
+        ext_mocks.projects_table.put_item.assert_called_once()
     
-    @patch('functions.external_data_sync_handler.projects_table')
-    def test_upsert_policy_update(self, mock_table):
+    def test_upsert_policy_update(self, ext_mocks):
         """정책 데이터 업데이트 테스트"""
-        mock_table.get_item.return_value = {"Item": {"policy_external_id": "P001"}}
-        mock_table.update_item.return_value = {}
+        ext_mocks.projects_table.get_item.return_value = {"Item": {"policy_external_id": "P001"}}
+        ext_mocks.projects_table.update_item.return_value = {}
         
         policy_data = {
             "policyId": "P001",
@@ -93,12 +110,11 @@ class TestExternalData:
         result = _upsert_policy(policy_data)
         
         assert result == "update"
-        mock_table.update_item.assert_called_once()
+        ext_mocks.projects_table.update_item.assert_called_once()
     
-    @patch('functions.external_data_sync_handler._sync_policies_by_keyword')
-    def test_scheduled_sync(self, mock_sync):
+    def test_scheduled_sync(self, ext_mocks):
         """정기 동기화 테스트"""
-        mock_sync.return_value = {
+        ext_mocks.sync_policies_by_keyword.return_value = {
             "total": 5,
             "inserted": 3,
             "updated": 2,
@@ -109,12 +125,11 @@ class TestExternalData:
         response = handler(event, {})
         
         assert response["statusCode"] == 200
-        assert mock_sync.call_count == 4  # 4개 키워드
+        assert ext_mocks.sync_policies_by_keyword.call_count == 4  # 4개 키워드
     
-    @patch('functions.external_data_sync_handler._sync_policies_by_keyword')
-    def test_manual_sync(self, mock_sync):
+    def test_manual_sync(self, ext_mocks):
         """수동 동기화 테스트"""
-        mock_sync.return_value = {
+        ext_mocks.sync_policies_by_keyword.return_value = {
             "total": 3,
             "inserted": 2,
             "updated": 1,
@@ -3,10 +3,6 @@
 """
 
 import json
-import os
-import sys
-
-sys.path.append(os.path.join(os.path.dirname(__file__), "..", "infra"))
 
 from src.functions.extract_handler import handler as extract_handler
 from src.functions.question_handler import handler as question_handler
@@ -3,12 +3,15 @@
 """
 
 import asyncio
+import functools
 import json
 import random
-import statistics
-import time
+from statistics import fmean
 
 import aiohttp
+import numpy as np
+
+JSON_HEADERS = {"Content-Type": "application/json"}
 
 
 class LoadTester:
@@ -19,38 +22,54 @@ class LoadTester:
         self.max_workers = max_workers
         self.results = []
 
-    async def make_request(self, session: aiohttp.ClientSession, endpoint: str, payload: dict):
-        """단일 HTTP 요청 실행"""
-        start_time = time.time()
+    async def make_request(self, session: aiohttp.ClientSession, endpoint: str, payload, scheduled_at=None):
+        """단일 HTTP 요청 실행 (payload는 dict 또는 미리 직렬화된 bytes)
+
+        scheduled_at(loop.time 기준 발행 예정 시각)을 넘기면 응답시간을 그 시각부터 측정해
+        동시성 제한으로 대기한 시간도 지연시간에 포함 (coordinated omission 방지)
+        """
+        if isinstance(payload, bytes):
+            request_kwargs = {"data": payload, "headers": JSON_HEADERS}
+        else:
+            request_kwargs = {"json": payload}
+
+        clock = asyncio.get_running_loop().time
+        sent_at = clock()
+        start_time = sent_at if scheduled_at is None else scheduled_at
+        queue_wait = (sent_at - start_time) * 1000  # ms
 
         try:
-            async with session.post(f"{self.base_url}{endpoint}", json=payload) as response:
-                response_time = (time.time() - start_time) * 1000  # ms
+            async with session.post(f"{self.base_url}{endpoint}", **request_kwargs) as response:
+                response_time = (clock() - start_time) * 1000  # ms
                 status = response.status
 
                 if status == 200:
-                    data = await response.json()
+                    # 응답을 다시 직렬화하지 않고 수신한 원본 바이트 길이로 크기 측정
+                    body = await response.read()
                     return {
                         "success": True,
                         "response_time": response_time,
+                        "queue_wait": queue_wait,
                         "status": status,
                         "endpoint": endpoint,
-                        "data_size": len(json.dumps(data)),
+                        "data_size": len(body),
                     }
                 else:
                     return {
                         "success": False,
                         "response_time": response_time,
+                        "queue_wait": queue_wait,
                         "status": status,
                         "endpoint": endpoint,
                         "error": f"HTTP {status}",
                     }
 
         except Exception as e:
-            response_time = (time.time() - start_time) * 1000
+            response_time = (clock() - start_time) * 1000
             return {
                 "success": False,
                 "response_time": response_time,
+                "queue_wait": queue_wait,
                 "status": 0,
                 "endpoint": endpoint,
                 "error": str(e),
@@ -107,38 +126,68 @@ class LoadTester:
         }
         return payloads
 
+    @functools.cached_property
+    def payloads(self):
+        """테스트 페이로드 - 인스턴스당 한 번만 생성해 재사용"""
+        return self.generate_test_payloads()
+
+    @functools.cached_property
+    def payload_bodies(self):
+        """엔드포인트별 요청 본문을 bytes로 한 번만 직렬화"""
+        return {
+            endpoint: [json.dumps(payload, ensure_ascii=False).encode() for payload in payloads]
+            for endpoint, payloads in self.payloads.items()
+        }
+
     async def run_load_test(self, rps_target: int = 100, duration_seconds: int = 60):
         """부하 테스트 실행"""
         print(f"부하 테스트 시작: {rps_target} RPS, {duration_seconds}초 동안")
 
-        payloads = self.generate_test_payloads()
-        endpoints = list(payloads.keys())
-
-        start_time = time.time()
-        all_results = []
+        bodies = self.payload_bodies
+        endpoints = list(bodies.keys())
 
         # RPS 제어를 위한 간격 계산
         request_interval = 1.0 / rps_target
+        num_requests = int(rps_target * duration_seconds)
+
+        # 요청별 엔드포인트/페이로드 선택을 발행 루프 밖에서 한 번에 추첨
+        rng = np.random.default_rng()
+        endpoint_idx = rng.integers(0, len(endpoints), size=num_requests).tolist()
+        payload_draws = rng.random(num_requests).tolist()
+
+        # 테스트 전체에서 하나의 세션을 재사용 (keep-alive 연결 풀링)
+        connector = aiohttp.TCPConnector(
+            limit=self.max_workers,
+            limit_per_host=self.max_workers,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True,
+        )
+        timeout = aiohttp.ClientTimeout(total=10)
+        semaphore = asyncio.Semaphore(self.max_workers)
+        loop = asyncio.get_running_loop()
 
-        while time.time() - start_time < duration_seconds:
-            batch_start = time.time()
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+
+            async def fire(endpoint, payload, scheduled_at):
+                async with semaphore:
+                    return await self.make_request(session, endpoint, payload, scheduled_at)
 
-            # 랜덤 엔드포인트 선택
-            endpoint = random.choice(endpoints)
-            payload = random.choice(payloads[endpoint])
+            # 응답 완료와 무관하게 고정 간격으로 요청 발행 (open-loop)
+            tasks = []
+            start_time = loop.time()
+            next_tick = start_time
 
-            # 단일 요청 실행
-            connector = aiohttp.TCPConnector(limit=10)
-            timeout = aiohttp.ClientTimeout(total=10)
+            for i in range(num_requests):
+                endpoint = endpoints[endpoint_idx[i]]
+                candidates = bodies[endpoint]
+                body = candidates[int(payload_draws[i] * len(candidates))]
+                tasks.append(asyncio.create_task(fire(endpoint, body, next_tick)))
 
-            async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
-                result = await self.make_request(session, endpoint, payload)
-                all_results.append(result)
+                # 누적 오차 없이 다음 발행 시각까지 대기
+                next_tick += request_interval
+                await asyncio.sleep(max(0.0, next_tick - loop.time()))
 
-            # RPS 제어를 위한 대기
-            elapsed = time.time() - batch_start
-            if elapsed < request_interval:
-                await asyncio.sleep(request_interval - elapsed)
+            all_results = await asyncio.gather(*tasks)
 
         self.results = all_results
         return self.analyze_results()
@@ -148,71 +197,85 @@ class LoadTester:
         if not self.results:
             return {"error": "No results to analyze"}
 
-        # 성공/실패 분리
-        successful = [r for r in self.results if r["success"]]
-        failed = [r for r in self.results if not r["success"]]
+        # 결과를 한 번만 순회해 배열로 변환
+        n = len(self.results)
+        response_times = np.fromiter((r["response_time"] for r in self.results), dtype=np.float64, count=n)
+        success = np.fromiter((r["success"] for r in self.results), dtype=bool, count=n)
+        endpoints = np.array([r["endpoint"] for r in self.results])
 
-        # 응답시간 통계
-        response_times = [r["response_time"] for r in successful]
+        # 응답시간 통계 (정렬 1회로 백분위수 계산)
+        successful_times = np.sort(response_times[success])
 
-        if response_times:
+        if successful_times.size:
             response_stats = {
-                "min": min(response_times),
-                "max": max(response_times),
-                "mean": statistics.mean(response_times),
-                "median": statistics.median(response_times),
-                "p95": self._percentile(response_times, 95),
-                "p99": self._percentile(response_times, 99),
+                "min": float(successful_times[0]),
+                "max": float(successful_times[-1]),
+                "mean": float(successful_times.mean()),
+                "median": float(np.median(successful_times)),
+                "p95": self._percentile(successful_times, 95),
+                "p99": self._percentile(successful_times, 99),
             }
         else:
             response_stats = {}
 
+        # 동시성 제한(세마포어)으로 발행이 밀린 시간 - 응답시간에 이미 포함된 부분
+        queue_waits = np.fromiter((r.get("queue_wait", 0.0) for r in self.results), dtype=np.float64, count=n)
+        queue_wait_stats = {
+            "mean": float(queue_waits.mean()),
+            "max": float(queue_waits.max()),
+            "p95": self._percentile(np.sort(queue_waits), 95),
+        }
+
         # 엔드포인트별 통계
-        endpoint_stats = {}
-        for endpoint in set(r["endpoint"] for r in self.results):
-            endpoint_results = [r for r in self.results if r["endpoint"] == endpoint]
-            endpoint_successful = [r for r in endpoint_results if r["success"]]
+        endpoint_names, endpoint_idx = np.unique(endpoints, return_inverse=True)
+        totals = np.bincount(endpoint_idx, minlength=endpoint_names.size)
+        successes = np.bincount(endpoint_idx, weights=success, minlength=endpoint_names.size)
+        time_sums = np.bincount(
+            endpoint_idx, weights=np.where(success, response_times, 0.0), minlength=endpoint_names.size
+        )
 
+        endpoint_stats = {}
+        for i, endpoint in enumerate(endpoint_names.tolist()):
+            endpoint_successful = int(successes[i])
             endpoint_stats[endpoint] = {
-                "total_requests": len(endpoint_results),
-                "successful_requests": len(endpoint_successful),
-                "success_rate": len(endpoint_successful) / len(endpoint_results) * 100,
-                "avg_response_time": statistics.mean(
-                    [r["response_time"] for r in endpoint_successful]
-                )
+                "total_requests": int(totals[i]),
+                "successful_requests": endpoint_successful,
+                "success_rate": endpoint_successful / int(totals[i]) * 100,
+                "avg_response_time": float(time_sums[i] / endpoint_successful)
                 if endpoint_successful
                 else 0,
             }
 
         # 에러 분석
+        errors = [r.get("error", "Unknown") for r in self.results if not r["success"]]
         error_types = {}
-        for result in failed:
-            error = result.get("error", "Unknown")
-            error_types[error] = error_types.get(error, 0) + 1
+        if errors:
+            error_names, error_counts = np.unique(np.array(errors), return_counts=True)
+            error_types = dict(zip(error_names.tolist(), error_counts.tolist()))
+
+        successful_count = int(success.sum())
 
         return {
             "summary": {
-                "total_requests": len(self.results),
-                "successful_requests": len(successful),
-                "failed_requests": len(failed),
-                "success_rate": len(successful) / len(self.results) * 100,
+                "total_requests": n,
+                "successful_requests": successful_count,
+                "failed_requests": n - successful_count,
+                "success_rate": successful_count / n * 100,
                 "total_duration": max(r.get("timestamp", 0) for r in self.results)
-                - min(r.get("timestamp", 0) for r in self.results)
-                if self.results
-                else 0,
+                - min(r.get("timestamp", 0) for r in self.results),
             },
             "response_time_stats": response_stats,
+            "queue_wait_stats": queue_wait_stats,
             "endpoint_stats": endpoint_stats,
             "error_analysis": error_types,
         }
 
-    def _percentile(self, data, percentile):
-        """백분위수 계산"""
-        if not data:
+    def _percentile(self, sorted_data, percentile):
+        """정렬된 배열에서 백분위수 조회"""
+        if not len(sorted_data):
             return 0
-        sorted_data = sorted(data)
         index = int(len(sorted_data) * percentile / 100)
-        return sorted_data[min(index, len(sorted_data) - 1)]
+        return float(sorted_data[min(index, len(sorted_data) - 1)])
 
 
 class StressTester:
@@ -283,9 +346,7 @@ async def run_performance_benchmark():
     )
 
     success_count = sum(1 for r in concurrent_results if r["success"])
-    avg_response_time = statistics.mean(
-        [r["response_time"] for r in concurrent_results if r["success"]]
-    )
+    avg_response_time = fmean(r["response_time"] for r in concurrent_results if r["success"])
 
     print(f"동시 요청 1000개 중 {success_count}개 성공")
     print(f"평균 응답시간: {avg_response_time:.2f}ms")
@@ -2,14 +2,12 @@
 관측성 및 모니터링 테스트
 """
 
-import os
-import sys
+import threading
 import time
-
-sys.path.append(os.path.join(os.path.dirname(__file__), "..", "infra"))
+from unittest.mock import MagicMock, patch
 
 from src.common.cache_strategy import PolicyCache
-from src.common.monitoring import MetricCollector, create_dashboard_config
+from src.common.monitoring import MAX_METRICS_PER_REQUEST, MetricCollector, create_dashboard_config
 from src.common.observability import HealthChecker
 
 
@@ -26,6 +24,39 @@ def test_metric_collector():
     assert metric["Unit"] == "Count"
 
 
+def test_flush_metrics_batches():
+    """메트릭을 MAX_METRICS_PER_REQUEST 단위로 나눠 전송"""
+    collector = MetricCollector()
+    for i in range(MAX_METRICS_PER_REQUEST * 2 + 5):
+        collector.add_metric("TestMetric", float(i))
+
+    client = MagicMock()
+    with patch("src.common.monitoring._get_cloudwatch_client", return_value=client):
+        collector.flush_metrics()
+
+    batch_sizes = [len(c.kwargs["MetricData"]) for c in client.put_metric_data.call_args_list]
+    assert batch_sizes == [MAX_METRICS_PER_REQUEST, MAX_METRICS_PER_REQUEST, 5]
+    assert collector.metrics == []
+
+
+def test_flush_metrics_keeps_unsent_on_failure():
+    """배치 전송 실패 시 전송하지 못한 메트릭만 유지"""
+    collector = MetricCollector()
+    total = MAX_METRICS_PER_REQUEST * 2 + 5
+    for i in range(total):
+        collector.add_metric("TestMetric", float(i))
+
+    client = MagicMock()
+    client.put_metric_data.side_effect = [None, Exception("Throttling")]
+    with patch("src.common.monitoring._get_cloudwatch_client", return_value=client):
+        collector.flush_metrics()
+
+    # 첫 배치만 전송 성공 - 두 번째 배치부터 남음
+    assert client.put_metric_data.call_count == 2
+    assert len(collector.metrics) == total - MAX_METRICS_PER_REQUEST
+    assert collector.metrics[0]["Value"] == float(MAX_METRICS_PER_REQUEST)
+
+
 def test_policy_cache():
     """정책 캐싱 테스트"""
     cache = PolicyCache(ttl_seconds=1)
@@ -47,6 +78,31 @@ def test_policy_cache():
     assert expired_result is None
 
 
+def test_policy_cache_lru_eviction():
+    """최대 크기 초과 시 가장 오래 사용하지 않은 항목 제거 테스트"""
+    cache = PolicyCache(max_size=2)
+
+    cache.set({"id": "a"}, "policy", {"score": 1})
+    cache.set({"id": "b"}, "policy", {"score": 2})
+
+    # a를 조회해 최근 사용으로 갱신
+    assert cache.get({"id": "a"}, "policy") == {"score": 1}
+
+    # c 추가 시 가장 오래 사용하지 않은 b가 제거됨
+    cache.set({"id": "c"}, "policy", {"score": 3})
+
+    assert len(cache.cache) == 2
+    assert cache.get({"id": "b"}, "policy") is None
+    assert cache.get({"id": "a"}, "policy") == {"score": 1}
+    assert cache.get({"id": "c"}, "policy") == {"score": 3}
+
+    # 기존 키 갱신은 다른 항목을 제거하지 않음
+    cache.set({"id": "a"}, "policy", {"score": 10})
+    assert len(cache.cache) == 2
+    assert cache.get({"id": "c"}, "policy") == {"score": 3}
+    assert cache.get({"id": "a"}, "policy") == {"score": 10}
+
+
 def test_dashboard_config():
     """대시보드 설정 테스트"""
     config = create_dashboard_config()
@@ -82,6 +138,59 @@ def test_health_checker():
     assert results["checks"]["unhealthy_service"]["status"] == "unhealthy"
 
 
+def test_health_checker_timeout():
+    """응답 없는 체크는 타임아웃으로 처리하고 기다리지 않음"""
+    checker = HealthChecker(timeout_seconds=0.05)
+    release = threading.Event()
+
+    def blocking_check():
+        release.wait(5)
+        return True
+
+    checker.add_check("blocking_service", blocking_check)
+    checker.add_check("healthy_service", lambda: True)
+
+    try:
+        start = time.monotonic()
+        results = checker.run_checks()
+        elapsed = time.monotonic() - start
+    finally:
+        release.set()
+
+    assert elapsed < 0.5
+    assert results["overall_status"] == "unhealthy"
+    assert results["checks"]["blocking_service"] == {"status": "unhealthy", "error": "timeout"}
+    assert results["checks"]["healthy_service"]["status"] == "healthy"
+
+
+def test_health_checker_slow_check_bounded_by_timeout():
+    """느린 체크가 있어도 run_checks는 타임아웃 근처에서 반환하고 스레드 풀을 재사용"""
+    checker = HealthChecker(timeout_seconds=0.05)
+
+    def slow_check():
+        time.sleep(1)
+        return True
+
+    checker.add_check("slow_service", slow_check)
+
+    try:
+        for _ in range(2):
+            start = time.monotonic()
+            results = checker.run_checks()
+            elapsed = time.monotonic() - start
+
+            assert elapsed < 0.5
+            assert results["checks"]["slow_service"] == {"status": "unhealthy", "error": "timeout"}
+
+        executor = checker._executor
+        checker.run_checks()
+        assert checker._executor is executor
+    finally:
+        checker.close()
+
+    assert checker._executor is None
+
+
 def test_cache_key_generation():
     """캐시 키 생성 테스트"""
     cache = PolicyCache()
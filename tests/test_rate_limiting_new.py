@@ -3,11 +3,8 @@ Rate Limiting 및 API 인증 테스트
 """
 
 import os
-import sys
 import time
 
-sys.path.append(os.path.join(os.path.dirname(__file__), "..", "infra"))
-
 from src.common.api_auth import check_authorization, validate_api_key
 from src.common.rate_limiter import RateLimiter, get_rate_limiter
 
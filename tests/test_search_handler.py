@@ -0,0 +1,57 @@
+"""
+검색 핸들러 테스트
+"""
+
+import json
+
+from src.functions.search_handler import MAX_BATCH_QUERIES
+from src.functions.search_handler import handler as search_handler
+
+
+def _post(body):
+    return search_handler({"body": json.dumps(body)}, {})
+
+
+def test_batch_search():
+    """여러 검색어 일괄 검색 테스트"""
+    response = _post({"queries": ["청년", "중소기업"]})
+
+    assert response["statusCode"] == 200
+    body = json.loads(response["body"])
+    assert body["total"] == 2
+    assert [r["query"] for r in body["results"]] == ["청년", "중소기업"]
+    assert all(r["total"] == len(r["results"]) for r in body["results"])
+
+
+def test_batch_search_invalid_queries():
+    """잘못된 queries 요청은 400 반환"""
+    invalid = [
+        "청년",  # 배열이 아님
+        [],
+        ["청년", ""],
+        ["청년", "   "],
+        ["청년", 1],
+        ["청년", None],
+        ["q"] * (MAX_BATCH_QUERIES + 1),
+    ]
+
+    for queries in invalid:
+        response = _post({"queries": queries})
+        assert response["statusCode"] == 400, queries
+        assert "error" in json.loads(response["body"])
+
+
+def test_batch_search_max_queries():
+    """최대 개수의 검색어는 허용"""
+    response = _post({"queries": ["청년"] * MAX_BATCH_QUERIES})
+
+    assert response["statusCode"] == 200
+    assert json.loads(response["body"])["total"] == MAX_BATCH_QUERIES
+
+
+def test_search_requires_query():
+    """검색어가 없으면 400 반환"""
+    response = _post({})
+
+    assert response["statusCode"] == 400
+    assert json.loads(response["body"])["example"] == "/search?q=창업지원"
@@ -2,16 +2,29 @@
 보안 테스트
 """
 
-import os
-import sys
+from unittest.mock import MagicMock, patch
 
 import pytest
 
-sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
-
-from src.common.circuit_breaker import CircuitBreaker
+from src.common.api_auth import check_authorization
+from src.common.circuit_breaker import CIRCUIT_OPEN, CircuitBreaker, CircuitBreakerOpenError, CircuitState
 from src.common.xss_protection import sanitize_input, validate_json_input
 
+SECOND = 1_000_000_000
+
+
+def _raise_runtime_error():
+    raise RuntimeError("API Error")
+
+
+def _open_breaker(cb, mock_time, now):
+    """failure_threshold만큼 실패시켜 회로를 OPEN 상태로 전환"""
+    mock_time.monotonic_ns.return_value = now
+    for _ in range(cb.failure_threshold):
+        with pytest.raises(RuntimeError):
+            cb.call(_raise_runtime_error)
+    assert cb.state is CircuitState.OPEN
+
 
 def test_xss_sanitization():
     """XSS 공격 방지 테스트"""
@@ -42,6 +55,43 @@ def test_circuit_breaker():
         cb.call(failing_function)
 
 
+def test_circuit_breaker_try_call():
+    """try_call 반환값 및 call 예외 전파 테스트"""
+    cb = CircuitBreaker(failure_threshold=1, timeout=60)
+
+    # 성공 - (True, 결과)
+    assert cb.try_call(lambda x: x * 2, 21) == (True, 42)
+
+    # 실패 - (False, 발생한 예외) 그대로 반환 (re-raise 없음)
+    error = RuntimeError("API Error")
+
+    def failing_function():
+        raise error
+
+    ok, value = cb.try_call(failing_function)
+    assert ok is False
+    assert value is error
+    assert cb.state is CircuitState.OPEN
+
+    # OPEN 상태 - 함수 실행 없이 (False, CIRCUIT_OPEN)
+    service = MagicMock()
+    assert cb.try_call(service) == (False, CIRCUIT_OPEN)
+    service.assert_not_called()
+
+
+def test_circuit_breaker_call_reraises_original():
+    """call은 원래 예외 객체를 그대로 다시 발생"""
+    cb = CircuitBreaker(failure_threshold=2, timeout=60)
+    error = ValueError("bad input")
+
+    def failing_function():
+        raise error
+
+    with pytest.raises(ValueError) as exc_info:
+        cb.call(failing_function)
+    assert exc_info.value is error
+
+
 def test_json_validation():
     """JSON 입력 검증 테스트"""
     malicious_data = {
@@ -53,3 +103,92 @@ def test_json_validation():
     assert "<script>" not in cleaned["message"]
     assert "onclick=" not in cleaned["user"]["name"]
     assert "안녕하세요" in cleaned["message"]
+
+
+def test_api_key_header_case_insensitive(monkeypatch):
+    """API 키 헤더는 대소문자와 무관하게 인식"""
+    monkeypatch.setenv("VALID_API_KEYS", "test-api-key-123")
+
+    for header in ("X-API-Key", "x-api-key", "X-Api-Key"):
+        assert check_authorization({"headers": {header: "test-api-key-123"}}) == (True, {"auth_type": "api_key"})
+
+    assert check_authorization({"headers": {"X-Api-Key": "wrong-key-000"}}) == (False, None)
+    assert check_authorization({"headers": None}) == (False, None)
+
+
+def test_circuit_breaker_single_probe():
+    """HALF_OPEN 상태에서는 probe 하나만 통과하고 나머지는 즉시 거부"""
+    cb = CircuitBreaker(failure_threshold=1, timeout=1)
+
+    with patch("src.common.circuit_breaker.time") as mock_time:
+        _open_breaker(cb, mock_time, 100 * SECOND)
+        mock_time.monotonic_ns.return_value = 101 * SECOND + 1
+
+        def probe():
+            # probe 실행 중 들어온 다른 요청은 upstream을 호출하지 않고 거부됨
+            assert cb.state is CircuitState.HALF_OPEN
+            with pytest.raises(CircuitBreakerOpenError):
+                cb.call(lambda: "should not run")
+            return "recovered"
+
+        assert cb.call(probe) == "recovered"
+
+    assert cb.state is CircuitState.CLOSED
+
+
+def test_circuit_breaker_probe_backoff():
+    """probe 실패 시 OPEN 유지 시간이 두 배로 늘고 max_timeout에서 멈춤"""
+    cb = CircuitBreaker(failure_threshold=1, timeout=1, max_timeout=3)
+
+    with patch("src.common.circuit_breaker.time") as mock_time:
+        now = 100 * SECOND
+        _open_breaker(cb, mock_time, now)
+
+        # 첫 probe 실패 -> 2초
+        now += SECOND + 1
+        mock_time.monotonic_ns.return_value = now
+        with pytest.raises(RuntimeError):
+            cb.call(_raise_runtime_error)
+        assert cb.state is CircuitState.OPEN
+        assert cb.open_timeout_ns == 2 * SECOND
+
+        # 기본 timeout만 지나서는 아직 거부
+        mock_time.monotonic_ns.return_value = now + SECOND + 1
+        with pytest.raises(CircuitBreakerOpenError):
+            cb.call(lambda: "should not run")
+
+        # 두 번째 probe 실패 -> 4초지만 상한 3초
+        now += 2 * SECOND + 1
+        mock_time.monotonic_ns.return_value = now
+        with pytest.raises(RuntimeError):
+            cb.call(_raise_runtime_error)
+        assert cb.open_timeout_ns == 3 * SECOND
+
+        # 실패한 probe 이후에도 대기 후 성공하면 CLOSED로 복구하고 대기 시간 초기화
+        now += 3 * SECOND + 1
+        mock_time.monotonic_ns.return_value = now
+        assert cb.call(lambda: "ok") == "ok"
+
+    assert cb.state is CircuitState.CLOSED
+    assert cb.open_timeout_ns == SECOND
+    assert cb.failure_count == 0
+
+
+def test_circuit_breaker_probe_interrupted():
+    """probe가 BaseException으로 중단돼도 다음 요청이 다시 probe가 될 수 있음"""
+    cb = CircuitBreaker(failure_threshold=1, timeout=1)
+
+    def interrupted():
+        raise KeyboardInterrupt
+
+    with patch("src.common.circuit_breaker.time") as mock_time:
+        _open_breaker(cb, mock_time, 100 * SECOND)
+        mock_time.monotonic_ns.return_value = 101 * SECOND + 1
+
+        with pytest.raises(KeyboardInterrupt):
+            cb.call(interrupted)
+        assert cb.state is CircuitState.HALF_OPEN
+
+        assert cb.call(lambda: "ok") == "ok"
+
+    assert cb.state is CircuitState.CLOSED
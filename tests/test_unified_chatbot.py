@@ -3,24 +3,30 @@
 """
 
 import json
-import os
-import sys
 
-sys.path.append(os.path.join(os.path.dirname(__file__), "..", "infra"))
+# 고정 요청 본문은 import 시 한 번만 직렬화
+SIMPLE_BODY = json.dumps(
+    {
+        "userProfile": {"region": "서울"},
+        "policyText": "만 39세 이하 서울 청년 대상 예비창업자 지원사업",
+    }
+)
+CHAT_BODY = json.dumps({"message": "안녕하세요", "session_id": "test_session"})
+BACKWARD_COMPAT_BODY = json.dumps(
+    {
+        "userProfile": {"region": "서울", "age": 30},
+        "policyText": "만 39세 이하 서울 거주 청년 대상",
+    }
+)
 
-from src.functions.chatbot_handler import handler as chatbot_handler
+# 핸들러는 dict 본문도 받으므로 모드 감지 테스트는 직렬화 없이 그대로 전달
+MODE_SIMPLE_BODY = {"userProfile": {"region": "서울"}, "policyText": "만 39세 이하"}
+MODE_CHAT_BODY = {"message": "안녕하세요", "session_id": "test"}
 
 
-def test_simple_question_mode():
+def test_simple_question_mode(chatbot_handler):
     """단순 질문 생성 모드 (기존 question_handler 호환)"""
-    event = {
-        "body": json.dumps(
-            {
-                "userProfile": {"region": "서울"},
-                "policyText": "만 39세 이하 서울 청년 대상 예비창업자 지원사업",
-            }
-        )
-    }
+    event = {"body": SIMPLE_BODY}
 
     response = chatbot_handler(event, {})
 
@@ -30,9 +36,9 @@ def test_simple_question_mode():
     assert len(body["question"]) > 0
 
 
-def test_conversational_mode():
+def test_conversational_mode(chatbot_handler):
     """대화형 챗봇 모드"""
-    event = {"body": json.dumps({"message": "안녕하세요", "session_id": "test_session"})}
+    event = {"body": CHAT_BODY}
 
     response = chatbot_handler(event, {})
 
@@ -40,17 +46,11 @@ def test_conversational_mode():
     assert response["type"] == "response"
 
 
-def test_mode_detection():
+def test_mode_detection(chatbot_handler):
     """모드 자동 감지 테스트"""
-    # 단순 질문 모드 감지
-    simple_body = {"userProfile": {"region": "서울"}, "policyText": "만 39세 이하"}
-
-    # 대화형 모드 감지
-    chat_body = {"message": "안녕하세요", "session_id": "test"}
-
-    # 각각 다른 응답 형식 확인
-    simple_event = {"body": json.dumps(simple_body)}
-    chat_event = {"body": json.dumps(chat_body)}
+    # 단순 질문 모드 / 대화형 모드 요청 - 각각 다른 응답 형식 확인
+    simple_event = {"body": MODE_SIMPLE_BODY}
+    chat_event = {"body": MODE_CHAT_BODY}
 
     simple_response = chatbot_handler(simple_event, {})
     chat_response = chatbot_handler(chat_event, {})
@@ -69,17 +69,10 @@ def test_mode_detection():
         assert "message" in chat_body_parsed
 
 
-def test_backward_compatibility():
+def test_backward_compatibility(chatbot_handler):
     """기존 API 호환성 테스트"""
     # 기존 question API 호출 방식
-    event = {
-        "body": json.dumps(
-            {
-                "userProfile": {"region": "서울", "age": 30},
-                "policyText": "만 39세 이하 서울 거주 청년 대상",
-            }
-        )
-    }
+    event = {"body": BACKWARD_COMPAT_BODY}
 
     response = chatbot_handler(event, {})
 